@@ -1,6 +1,9 @@
 import os
 import sys
+import json
+import hashlib
 import requests
+import numpy as np
 
 # 1. SETUP PATHS
 day1_dir = os.path.dirname(os.path.abspath(__file__)) # Current file: .../AoC2025/scripts/day1/day1.py
@@ -17,6 +20,10 @@ from utils import support
 DAY: int = 1
 YEAR: int = 2025
 
+# Dial configuration
+DIAL_SIZE: int = 100
+DIAL_START: int = 50
+
 def manual_fetch():
     cookie_path = os.path.join(project_root, 'secret', 'cookie.txt')
     try:
@@ -45,16 +52,271 @@ def manual_fetch():
         logger.error(f"Manual fetch crashed: {e}")
         return None
 
-def problemsolver(arr: list, part: int):
-    # Dial configuration
-    DIAL_SIZE = 100
-    current_pos = 50
+# "L68" -> "-68", "R48" -> "+48": every line becomes a signed integer literal
+SIGNS: bytes = bytes.maketrans(b"LR", b"-+")
+
+def _parse_rotations_bytes(buf: bytes) -> np.ndarray:
+    """
+    Parses raw "L68\nR48\n..." bytes into signed int64 deltas (R positive, L negative)
+    without building a Python object per rotation.
+    L/R are swapped for -/+ in one bytes.translate, then NumPy's C text reader
+    parses the whole block (blank lines and CRLF endings are skipped).
+    """
+    expected = buf.count(b"L") + buf.count(b"R")
+    if not expected:
+        # fromstring hands back a bogus element for text with no numbers
+        return np.zeros(0, dtype=np.int64)
+    deltas = np.fromstring(buf.translate(SIGNS), dtype=np.int64, sep="\n")
+    if deltas.size != expected:
+        raise ValueError(f"Parsed {deltas.size} rotations, expected {expected}")
+    return deltas
+
+def parse_rotations(arr: list) -> np.ndarray:
+    """Signed int64 deltas for every rotation line in arr."""
+    return _parse_rotations_bytes("\n".join(arr).encode())
+
+def dial_counts(deltas: np.ndarray, start_pos: int = DIAL_START, dial_size: int = DIAL_SIZE):
+    """
+    Vectorized dial simulation.
+
+    Positions are kept unwrapped (start + cumsum of deltas), so passing zero
+    is just crossing a multiple of dial_size:
+        R move p -> q: multiples in (p, q]    = q // n - p // n
+        L move p -> q: multiples in [q, p)    = (p - 1) // n - (q - 1) // n
+    The L form means starting on 0 and turning left doesn't count a visit.
+
+    Args:
+        deltas (np.ndarray): signed rotation amounts
+        start_pos (int, optional): Starting dial position. Defaults to DIAL_START.
+        dial_size (int, optional): Clicks per full turn. Defaults to DIAL_SIZE.
+
+    Returns:
+        (end_pos, part1, part2): final position (wrapped), zero landings, zero passes
+    """
+    if deltas.size == 0:
+        return start_pos, 0, 0
+
+    # Unwrapped positions, starting point included
+    pos = np.empty(deltas.size + 1, dtype=np.int64)
+    pos[0] = start_pos
+    np.cumsum(deltas, out=pos[1:])
+    pos[1:] += start_pos
+
+    # One division for everything: q // n, and the zero landings fall out as
+    # pos == q * n.  The L form differs from -(q // n - p // n) only when an
+    # endpoint sits on a multiple, which is what the zero landings fix up.
+    turns = pos // dial_size
+    on_zero = pos == turns * dial_size
+    part1 = int(np.count_nonzero(on_zero[1:]))
+
+    left = deltas < 0
+    part2 = (
+        int(np.abs(np.diff(turns)).sum())
+        + int(np.count_nonzero(on_zero[1:] & left))
+        - int(np.count_nonzero(on_zero[:-1] & left))
+    )
+    return int(pos[-1] - turns[-1] * dial_size), part1, part2
+
+SWEEP_CELLS: int = 1 << 22
+
+def dial_sweep(deltas: np.ndarray, starts, dial_sizes, max_cells: int = SWEEP_CELLS):
+    """
+    Batched what-if runs: zero counts for many (start position, dial size)
+    settings over the same rotations. Settings are broadcast as rows against
+    a block of rotations, so the only Python loop is over rotation blocks
+    (sized to keep settings x block under max_cells).
+
+    Args:
+        deltas (np.ndarray): signed rotation amounts
+        starts (array-like): start position per setting
+        dial_sizes (array-like): dial size per setting (broadcast against starts)
+        max_cells (int, optional): Cap on the working matrix size. Defaults to SWEEP_CELLS.
+
+    Returns:
+        (part1, part2): int64 arrays with one count per setting
+    """
+    starts, dial_sizes = np.broadcast_arrays(
+        np.asarray(starts, dtype=np.int64), np.asarray(dial_sizes, dtype=np.int64)
+    )
+    start = starts.reshape(-1, 1)
+    size = dial_sizes.reshape(-1, 1)
+    part1 = np.zeros(start.shape[0], dtype=np.int64)
+    part2 = np.zeros(start.shape[0], dtype=np.int64)
+
+    # Offsets from the start position before / after each rotation
+    after = np.cumsum(deltas)
+    before = np.concatenate(([0], after[:-1]))
+
+    step = max(1, max_cells // max(1, start.shape[0]))
+    for lo in range(0, deltas.size, step):
+        hi = lo + step
+        pos = start + after[lo:hi]
+        prev = start + before[lo:hi]
+        part1 += np.count_nonzero(pos % size == 0, axis=1)
+        part2 += np.where(
+            deltas[lo:hi] > 0,
+            pos // size - prev // size,
+            (prev - 1) // size - (pos - 1) // size,
+        ).sum(axis=1)
+    return part1, part2
+
+STREAM_BLOCK: int = 1 << 24
+
+def _consume_lines(f, pos: int, part1: int, part2: int, block_size: int, dial_size: int):
+    """
+    Runs every complete line left in the open binary file f through the dial.
+    Returns the updated (pos, part1, part2), the number of bytes consumed
+    (up to and including the last newline) and the unterminated tail.
+    """
+    consumed = 0
+    carry = b""
+    while block := f.read(block_size):
+        block = carry + block
+        cut = block.rfind(b"\n") + 1
+        carry = block[cut:]
+        consumed += cut
+        pos, zeros1, zeros2 = dial_counts(_parse_rotations_bytes(block[:cut]), pos, dial_size)
+        part1 += zeros1
+        part2 += zeros2
+    return pos, part1, part2, consumed, carry
+
+def stream_dial_counts(
+        path: str,
+        block_size: int = STREAM_BLOCK,
+        start_pos: int = DIAL_START,
+        dial_size: int = DIAL_SIZE
+    ):
+    """
+    Solves both parts in one pass over a rotation log of any size.
+    The file is read in binary blocks; a partial line at the end of a block
+    is carried over to the next one, so memory is bounded by block_size.
+
+    Args:
+        path (str): Rotation log, one "L68" / "R48" per line
+        block_size (int, optional): Bytes per read. Defaults to STREAM_BLOCK.
+        start_pos (int, optional): Starting dial position. Defaults to DIAL_START.
+        dial_size (int, optional): Clicks per full turn. Defaults to DIAL_SIZE.
+
+    Returns:
+        (part1, part2): zero landings, zero passes
+    """
+    with open(path, "rb") as f:
+        pos, part1, part2, _, carry = _consume_lines(f, start_pos, 0, 0, block_size, dial_size)
+
+    # Last line without a trailing newline
+    pos, zeros1, zeros2 = dial_counts(_parse_rotations_bytes(carry), pos, dial_size)
+    return part1 + zeros1, part2 + zeros2
+
+CHECKPOINT_SAMPLE: int = 1 << 16
+
+def _prefix_digest(f, offset: int) -> str:
+    """
+    Fingerprint of the first `offset` bytes of f: the length plus a blake2b of
+    its first and last CHECKPOINT_SAMPLE bytes. Sampling keeps the check O(1)
+    in the size of the history, while still catching rewrites at either end.
+    """
+    digest = hashlib.blake2b(str(offset).encode(), digest_size=16)
+    f.seek(0)
+    digest.update(f.read(min(offset, CHECKPOINT_SAMPLE)))
+    tail = max(0, offset - CHECKPOINT_SAMPLE)
+    f.seek(tail)
+    digest.update(f.read(offset - tail))
+    return digest.hexdigest()
+
+CHECKPOINT_KEYS = ("offset", "digest", "dial_size", "position", "part1", "part2")
+
+def _load_checkpoint(checkpoint_path: str):
+    """The saved state, or None if missing, unreadable or not the expected shape."""
+    try:
+        with open(checkpoint_path, "r") as f:
+            state = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if not isinstance(state, dict) or any(key not in state for key in CHECKPOINT_KEYS):
+        return None
+    return state
+
+def _save_checkpoint(checkpoint_path: str, state: dict):
+    with support.atomic_write(checkpoint_path, "w") as f:
+        json.dump(state, f)
+
+def solve_incremental(
+        path: str,
+        checkpoint_path: str = None,
+        block_size: int = STREAM_BLOCK,
+        dial_size: int = DIAL_SIZE
+    ):
+    """
+    Streams an append-only rotation log, resuming from the last checkpoint.
+
+    The checkpoint holds the dial position, both zero counters and the byte
+    offset of the last complete line consumed, keyed by a digest of that
+    prefix. If the digest still matches only the bytes after the offset are
+    read; otherwise (file rewritten, truncated, new dial) it starts over.
+
+    Args:
+        path (str): Rotation log, one "L68" / "R48" per line
+        checkpoint_path (str, optional): Where to keep the state. Defaults to path + ".ckpt".
+        block_size (int, optional): Bytes per read. Defaults to STREAM_BLOCK.
+        dial_size (int, optional): Clicks per full turn. Defaults to DIAL_SIZE.
+
+    Returns:
+        (part1, part2): zero landings, zero passes over the whole log
+    """
+    checkpoint_path = checkpoint_path or f"{path}.ckpt"
+    fresh = {"offset": 0, "position": DIAL_START, "part1": 0, "part2": 0}
+
+    with open(path, "rb") as f:
+        state = _load_checkpoint(checkpoint_path)
+        size = os.fstat(f.fileno()).st_size
+        if (
+            not state
+            or state.get("dial_size") != dial_size
+            or state["offset"] > size
+            or _prefix_digest(f, state["offset"]) != state["digest"]
+        ):
+            if state:
+                logger.info("Checkpoint does not match input, starting over")
+            state = fresh
+
+        f.seek(state["offset"])
+        pos, part1, part2, consumed, carry = _consume_lines(
+            f, state["position"], state["part1"], state["part2"], block_size, dial_size
+        )
+        offset = state["offset"] + consumed
+        _save_checkpoint(checkpoint_path, {
+            "offset": offset,
+            "digest": _prefix_digest(f, offset),
+            "dial_size": dial_size,
+            "position": pos,
+            "part1": part1,
+            "part2": part2,
+        })
+
+    # An unterminated last line counts toward the answer, but isn't checkpointed
+    # in case more of it is still being written.
+    pos, zeros1, zeros2 = dial_counts(_parse_rotations_bytes(carry), pos, dial_size)
+    return part1 + zeros1, part2 + zeros2
+
+def problemsolver(arr: list, part: int, mode: str = "numpy"):
+    """
+    Counts zero visits on the dial.
+
+    Modes:
+        numpy: cumulative sum over signed deltas (default)
+        loop:  step through each instruction
+    """
+    current_pos = DIAL_START
     zero_visits = 0
 
     instructions = []
     if not arr:
         return 0
 
+    if mode == "numpy":
+        _, part1, part2 = dial_counts(parse_rotations(arr))
+        return part1 if part == 1 else part2
+
     for row in arr:
         if not row.strip(): 
             continue
@@ -1,6 +1,8 @@
 import os
 import sys
 import requests
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 
 # 1. SETUP PATHS
 # Current file: .../AoC2025/scripts/day2/day2.py
@@ -69,35 +71,406 @@ def is_invalid_part2(num: int) -> bool:
     # (s+s)[1:-1] effectively searches for s in a shifted version of itself
     return s in (s + s)[1:-1]
 
-def problemsolver(arr: list, part: int):
-    if not arr:
-        return 0
-
+def parse_ranges(arr: list) -> list:
+    """
+    Parses the comma separated "start-end" input into a list of (start, end) tuples.
+    """
     full_input = "".join(arr).strip()
-    range_strings = full_input.split(',')
-    
-    total_sum = 0
-    
-    # Parse ranges
     ranges = []
-    for r in range_strings:
+    for r in full_input.split(','):
         if '-' in r:
             start_s, end_s = r.split('-')
             ranges.append((int(start_s), int(end_s)))
+    return ranges
+
+def _divisors(n: int) -> list:
+    """Proper divisors of n (every d < n with n % d == 0)."""
+    return [d for d in range(1, n) if n % d == 0]
+
+def _repeat_multiplier(length: int, period: int) -> int:
+    """
+    Multiplier M that repeats a period-digit block to fill length digits.
+    Example: length 6, period 2 -> M = 10101, so 12 * M = 121212.
+    """
+    return (10**length - 1) // (10**period - 1)
 
+def _base_bounds(lo: int, hi: int, length: int, period: int):
+    """
+    Range of period-digit bases whose repetition lands inside [lo, hi].
+    Returns (M, first_base, last_base); the range is empty if first > last.
+    """
+    mult = _repeat_multiplier(length, period)
+    first = max(10**(period - 1), -(-lo // mult))  # ceil(lo / M)
+    last = min(10**period - 1, hi // mult)
+    return mult, first, last
+
+def _sum_period(lo: int, hi: int, length: int, period: int) -> int:
+    """
+    Sum of every length-digit ID in [lo, hi] made by repeating a period-digit block.
+    The repeats are base * M for a run of consecutive bases, so it's an arithmetic series.
+    """
+    mult, first, last = _base_bounds(lo, hi, length, period)
+    if first > last:
+        return 0
+    return mult * (first + last) * (last - first + 1) // 2
+
+def _periods(length: int, part: int) -> list:
+    """Block sizes that make an ID of this length invalid for the given part."""
     if part == 1:
+        return [length // 2] if length % 2 == 0 else []
+    return _divisors(length)
+
+def sum_invalid_ids(start: int, end: int, part: int) -> int:
+    """
+    Closed form sum of invalid IDs in [start, end], split by digit length.
+
+    Part 1 only has the half-length period. Part 2 unions every proper divisor
+    period; an ID with smallest period d also repeats with every multiple of d,
+    so we sum by *primitive* period (Mobius style inclusion-exclusion):
+        primitive(d) = all(d) - sum(primitive(e) for e | d, e < d)
+    and add primitive(d) for each proper divisor d of the length.
+    """
+    total = 0
+    for length in range(len(str(start)), len(str(end)) + 1):
+        lo = max(start, 10**(length - 1))
+        hi = min(end, 10**length - 1)
+        if lo > hi:
+            continue
+
+        if part == 1:
+            for period in _periods(length, 1):
+                total += _sum_period(lo, hi, length, period)
+            continue
+
+        primitive = {}
+        for period in _divisors(length):
+            primitive[period] = _sum_period(lo, hi, length, period) - sum(
+                primitive[d] for d in _divisors(period)
+            )
+            total += primitive[period]
+    return total
+
+def iter_invalid_ids(start: int, end: int, part: int):
+    """
+    Yields every invalid ID in [start, end] in ascending order.
+    Work is proportional to the number of IDs produced, not the width of the range.
+    """
+    for length in range(len(str(start)), len(str(end)) + 1):
+        lo = max(start, 10**(length - 1))
+        hi = min(end, 10**length - 1)
+        if lo > hi:
+            continue
+
+        found = set()
+        for period in _periods(length, part):
+            mult, first, last = _base_bounds(lo, hi, length, period)
+            found.update(base * mult for base in range(first, last + 1))
+        yield from sorted(found)
+
+# Powers of ten that fit in int64 (10**18 is the largest)
+POW10 = np.array([10**i for i in range(19)], dtype=np.int64)
+DEFAULT_CHUNK: int = 1 << 20
+
+def _digit_lengths(nums: np.ndarray) -> np.ndarray:
+    """Number of decimal digits of each (positive) value."""
+    return np.searchsorted(POW10, nums, side="right")
+
+def np_is_invalid_part1(nums: np.ndarray) -> np.ndarray:
+    """
+    Vectorized Part 1 rule on an int64 array.
+    An even length L number is invalid when its top half equals its bottom half:
+    num // 10**(L/2) == num % 10**(L/2)
+    """
+    lengths = _digit_lengths(nums)
+    mask = np.zeros(nums.shape, dtype=bool)
+    for length in np.unique(lengths):
+        if length % 2:
+            continue
+        sel = lengths == length
+        half = POW10[length // 2]
+        vals = nums[sel]
+        mask[sel] = (vals // half) == (vals % half)
+    return mask
+
+def np_is_invalid_part2(nums: np.ndarray) -> np.ndarray:
+    """
+    Vectorized Part 2 rule on an int64 array.
+    A length L number repeats with period p when its low p digits times the
+    repeat multiplier rebuild the whole number.
+    """
+    lengths = _digit_lengths(nums)
+    mask = np.zeros(nums.shape, dtype=bool)
+    for length in np.unique(lengths):
+        sel = lengths == length
+        vals = nums[sel]
+        hit = np.zeros(vals.shape, dtype=bool)
+        for period in _divisors(int(length)):
+            mult = _repeat_multiplier(int(length), period)
+            hit |= (vals % POW10[period]) * mult == vals
+        mask[sel] = hit
+    return mask
+
+def _exact_sum(vals: np.ndarray) -> int:
+    """
+    Sums an int64 array without overflow by adding the high and low 32 bits separately.
+    """
+    if vals.size == 0:
+        return 0
+    high = int((vals >> 32).sum())
+    low = int((vals & 0xFFFFFFFF).sum())
+    return (high << 32) + low
+
+def scan_ranges_numpy(ranges: list, predicate, chunk_size: int = DEFAULT_CHUNK) -> int:
+    """
+    Sums every number in the ranges that matches predicate.
+    Each range is walked in int64 chunks of at most chunk_size, so peak memory
+    stays bounded no matter how wide the range is.
+
+    Args:
+        ranges (list): (start, end) tuples, inclusive
+        predicate (callable): takes an int64 array, returns a bool mask
+        chunk_size (int, optional): numbers per chunk. Defaults to DEFAULT_CHUNK.
+
+    Returns:
+        total (int): sum of the matching numbers
+    """
+    total = 0
+    for start, end in ranges:
+        for lo in range(start, end + 1, chunk_size):
+            chunk = np.arange(lo, min(lo + chunk_size, end + 1), dtype=np.int64)
+            total += _exact_sum(chunk[predicate(chunk)])
+    return total
+
+def merge_ranges(ranges: list) -> list:
+    """
+    Sorts and merges overlapping (or touching) ranges so every ID appears once.
+    """
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+def shard_ranges(ranges: list, n_shards: int) -> list:
+    """
+    Splits disjoint ranges into n_shards lists holding (nearly) equal ID counts.
+    A range that straddles a shard boundary is cut in two.
+    """
+    total = sum(end - start + 1 for start, end in ranges)
+    if total == 0:
+        return []
+    n_shards = max(1, min(n_shards, total))
+    target = -(-total // n_shards)  # ceil
+
+    shards, current, room = [], [], target
+    for start, end in ranges:
+        while start <= end:
+            take = min(room, end - start + 1)
+            current.append((start, start + take - 1))
+            start += take
+            room -= take
+            if room == 0:
+                shards.append(current)
+                current, room = [], target
+    if current:
+        shards.append(current)
+    return shards
+
+def _scan_ranges_brute(ranges: list, part: int) -> int:
+    """Tests every number in the ranges with the string based rule."""
+    is_invalid = is_invalid_part1 if part == 1 else is_invalid_part2
+    total = 0
+    for start, end in ranges:
+        for num in range(start, end + 1):
+            if is_invalid(num):
+                total += num
+    return total
+
+def _scan_shard(shard: list, part: int, predicate=None, chunk_size: int = DEFAULT_CHUNK) -> int:
+    """
+    Process pool worker. Brute force scan of one shard, or a chunked
+    NumPy scan when a (picklable) predicate is supplied.
+    """
+    if predicate is None:
+        return _scan_ranges_brute(shard, part)
+    return scan_ranges_numpy(shard, predicate, chunk_size)
+
+def scan_ranges_parallel(
+        ranges: list,
+        part: int,
+        workers: int = None,
+        predicate=None,
+        chunk_size: int = DEFAULT_CHUNK
+    ) -> int:
+    """
+    Merges the ranges, splits the ID span into balanced shards and sums the
+    shards in a process pool.
+
+    Args:
+        ranges (list): (start, end) tuples, inclusive. Overlaps are only counted once.
+        part (int): Which rule to apply when no predicate is given
+        workers (int, optional): Pool size. Defaults to os.cpu_count().
+        predicate (callable, optional): Top level vectorized predicate. Defaults to None (brute force).
+        chunk_size (int, optional): Chunk size for the NumPy scan. Defaults to DEFAULT_CHUNK.
+
+    Returns:
+        total (int): sum of the invalid IDs
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = shard_ranges(merge_ranges(ranges), workers)
+    if len(shards) <= 1:
+        return sum(_scan_shard(shard, part, predicate, chunk_size) for shard in shards)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_scan_shard, shard, part, predicate, chunk_size)
+            for shard in shards
+        ]
+        return sum(f.result() for f in futures)
+
+INT64_MAX: int = np.iinfo(np.int64).max
+
+class InvalidIdIndex:
+    """
+    Every part 1 / part 2 invalid ID below 10**max_digits as a sorted int64
+    array plus a prefix sum array. The sum over any [start, end] is then two
+    binary searches and a subtraction.
+    """
+    def __init__(self, max_digits: int, ids: dict, prefix: dict):
+        self.max_digits = max_digits
+        self.limit = 10**max_digits - 1
+        self.ids = ids          # part -> sorted int64 IDs
+        self.prefix = prefix    # part -> int64 prefix sums, prefix[0] == 0
+
+    @classmethod
+    def build(cls, max_digits: int):
+        ids, prefix = {}, {}
+        for part in (1, 2):
+            found = list(iter_invalid_ids(1, 10**max_digits - 1, part))
+            if sum(found) > INT64_MAX:
+                raise ValueError(f"max_digits={max_digits} overflows the int64 prefix sums")
+            ids[part] = np.array(found, dtype=np.int64)
+            prefix[part] = np.concatenate(([0], np.cumsum(ids[part]))).astype(np.int64)
+        return cls(max_digits, ids, prefix)
+
+    @staticmethod
+    def _npz_path(path: str) -> str:
+        """np.savez appends .npz when it's missing; do the same on load so both agree."""
+        path = os.fspath(path)
+        return path if path.endswith(".npz") else f"{path}.npz"
+
+    def save(self, path: str):
+        with support.atomic_write(self._npz_path(path)) as f:
+            np.savez(
+                f,
+                max_digits=self.max_digits,
+                ids1=self.ids[1], prefix1=self.prefix[1],
+                ids2=self.ids[2], prefix2=self.prefix[2],
+            )
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(cls._npz_path(path)) as f:
+            return cls(
+                int(f["max_digits"]),
+                {1: f["ids1"], 2: f["ids2"]},
+                {1: f["prefix1"], 2: f["prefix2"]},
+            )
+
+    @classmethod
+    def load_or_build(cls, path: str, max_digits: int):
+        """
+        Loads the index saved at path if it covers max_digits, otherwise
+        builds one to max_digits and saves it there for the next run.
+        """
+        if os.path.exists(cls._npz_path(path)):
+            index = cls.load(path)
+            if index.max_digits >= max_digits:
+                return index
+        logger.info(f"Building invalid ID index to {max_digits} digits at {path}")
+        index = cls.build(max_digits)
+        index.save(path)
+        return index
+
+    def _check(self, end):
+        if end > self.limit:
+            raise ValueError(f"Range end {end} is beyond the index bound {self.limit}")
+
+    def query(self, start: int, end: int, part: int) -> int:
+        """Sum of invalid IDs in [start, end]. An empty (start > end) range sums to 0."""
+        self._check(end)
+        ids, prefix = self.ids[part], self.prefix[part]
+        lo = np.searchsorted(ids, start, side="left")
+        hi = max(lo, np.searchsorted(ids, end, side="right"))
+        return int(prefix[hi] - prefix[lo])
+
+    def query_batch(self, starts, ends, part: int) -> np.ndarray:
+        """Vectorized query over arrays of starts / ends. Returns an int64 array of sums."""
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        if ends.size:
+            self._check(int(ends.max()))
+        ids, prefix = self.ids[part], self.prefix[part]
+        lo = np.searchsorted(ids, starts, side="left")
+        hi = np.maximum(lo, np.searchsorted(ids, ends, side="right"))
+        return prefix[hi] - prefix[lo]
+
+def problemsolver(
+        arr: list,
+        part: int,
+        mode: str = "closed",
+        predicate=None,
+        chunk_size: int = DEFAULT_CHUNK,
+        workers: int = None,
+        index: InvalidIdIndex = None,
+        index_path: str = None
+    ):
+    """
+    Sums the invalid IDs across every range in the input.
+
+    Modes:
+        closed: arithmetic sum per digit length / period (default)
+        numpy:  chunked vectorized scan with predicate (defaults to np_is_invalid_partN)
+        parallel: merge overlapping ranges, then scan balanced shards on `workers` processes
+        index:  prefix sum lookups against `index`. Without one it's loaded from
+                `index_path` (built and saved there if missing or too small),
+                or built in memory when no path is given either
+        brute:  test every number in every range with is_invalid_partN
+    """
+    if not arr:
+        return 0
+
+    ranges = parse_ranges(arr)
+    total_sum = 0
+
+    if mode == "closed":
         for start, end in ranges:
-            for num in range(start, end + 1):
-                if is_invalid_part1(num):
-                    total_sum += num
-                    
-    elif part == 2:
-        for start, end in ranges:
-            for num in range(start, end + 1):
-                if is_invalid_part2(num):
-                    total_sum += num
-                    
-    return total_sum
+            total_sum += sum_invalid_ids(start, end, part)
+        return total_sum
+
+    if mode == "numpy":
+        if predicate is None:
+            predicate = np_is_invalid_part1 if part == 1 else np_is_invalid_part2
+        return scan_ranges_numpy(ranges, predicate, chunk_size)
+
+    if mode == "parallel":
+        return scan_ranges_parallel(ranges, part, workers, predicate, chunk_size)
+
+    if mode == "index":
+        if not ranges:
+            return 0
+        if index is None:
+            max_digits = max(len(str(end)) for _, end in ranges)
+            if index_path:
+                index = InvalidIdIndex.load_or_build(index_path, max_digits)
+            else:
+                index = InvalidIdIndex.build(max_digits)
+        starts, ends = zip(*ranges)
+        return int(sum(int(v) for v in index.query_batch(starts, ends, part)))
+
+    return _scan_ranges_brute(ranges, part)
 
 @log_time
 def part_A():
@@ -1,6 +1,9 @@
 import os
 import sys
+import operator
 import requests
+from functools import partial
+import numpy as np
 
 # 1. SETUP PATHS
 # Current file: .../AoC2025/scripts/day3/day3.py
@@ -49,53 +52,106 @@ def manual_fetch():
         logger.error(f"Manual fetch crashed: {e}")
         return None
 
+def max_joltage_k(line: str, k: int) -> int:
+    """
+    Largest k-digit number formed by picking k digits in order from the line.
+    Monotonic stack: pop smaller digits while enough digits remain to still
+    fill k slots, so each digit is pushed / popped at most once -> O(n).
+    """
+    digits = line.strip()
+    if len(digits) < k:
+        return 0
+
+    drops = len(digits) - k  # how many digits we can still throw away
+    stack = []
+    for d in digits:
+        while drops and stack and stack[-1] < d:
+            stack.pop()
+            drops -= 1
+        stack.append(d)
+    return int("".join(stack[:k]))
+
 def get_max_joltage(line: str) -> int:
     """
     Finds the largest 2-digit number possible by picking two digits 
     at indices i and j where i < j.
     """
-    digits = line.strip()
-    if len(digits) < 2:
-        return 0
-        
-    max_val = -1
-    
-    # Iterate through every possible first digit (tens place)
-    # We stop at len-1 because the first digit must have at least one digit after it
-    for i in range(len(digits) - 1):
-        digit1 = digits[i]
-        
-        # Optimization: Find the largest digit in the remainder of the string
-        remainder = digits[i+1:]
-        max_digit2 = max(remainder) # '9' > '8' > ... string comparison works for single digits
-        
-        # Form the number
-        val = int(digit1 + max_digit2)
-        
-        if val > max_val:
-            max_val = val
-            
-            # Optimization: If we found '99', we can't get better.
-            if max_val == 99:
-                return 99
-                
-    return max_val
-
-def problemsolver(arr: list, part: int):
+    return max_joltage_k(line, 2)
+
+def load_bank_matrix(lines: list):
+    """
+    Stacks equal length bank lines into an (n, L) uint8 digit matrix.
+    Returns None for ragged input so callers can fall back to the per line engine.
+    """
+    if not lines:
+        return None
+    width = len(lines[0])
+    if any(len(line) != width for line in lines):
+        return None
+    raw = np.frombuffer("".join(lines).encode(), dtype=np.uint8)
+    return (raw - ord('0')).reshape(len(lines), width)
+
+def batch_max_joltage(mat: np.ndarray, k: int) -> np.ndarray:
+    """
+    Max k-digit joltage for every row of a digit matrix at once.
+
+    k == 2: the tens digit is the leftmost max of row[:-1] (argmax), the units
+    digit is the reverse cumulative max just after it.
+    k > 2: the same greedy pick repeated k times, each step an argmax over the
+    window [previous pick + 1, L - k + step] on every row together.
+    """
+    n, width = mat.shape
+    if width < k:
+        return np.zeros(n, dtype=np.int64)
+    rows = np.arange(n)
+
+    if k == 2:
+        first = np.argmax(mat[:, :-1], axis=1)
+        suffix_max = np.maximum.accumulate(mat[:, ::-1], axis=1)[:, ::-1]
+        return mat[rows, first].astype(np.int64) * 10 + suffix_max[rows, first + 1]
+
+    # Shift digits to 1..10 so 0 can mark columns outside the window
+    shifted = mat.astype(np.int8) + 1
+    cols = np.arange(width)
+    lo = np.zeros(n, dtype=np.int64)
+    total = np.zeros(n, dtype=np.int64)
+    for step in range(k):
+        hi = width - k + step + 1
+        window = np.where(cols[:hi] >= lo[:, None], shifted[:, :hi], 0)
+        pick = np.argmax(window, axis=1)
+        total = total * 10 + mat[rows, pick]
+        lo = pick + 1
+    return total
+
+def problemsolver(arr: list, part: int, batch: bool = True):
     if not arr:
         return 0
 
-    total_joltage = 0
+    # Part 1 turns on 2 batteries per bank, Part 2 turns on 12
+    k = 2 if part == 1 else 12
 
-    if part == 1:
-        for line in arr:
-            if not line.strip(): continue
-            total_joltage += get_max_joltage(line)
-        return total_joltage
+    lines = [line.strip() for line in arr if line.strip()]
 
-    if part == 2:
-        # Placeholder for Part 2
-        return 0
+    # Same length banks -> one matrix pass, ragged banks -> per line stack
+    if batch:
+        mat = load_bank_matrix(lines)
+        if mat is not None:
+            return int(batch_max_joltage(mat, k).sum())
+
+    total_joltage = 0
+    for line in lines:
+        total_joltage += max_joltage_k(line, k)
+    return total_joltage
+
+def solve_file(path: str, part: int, workers: int = None) -> int:
+    """
+    Sums the bank joltages of an input file across a process pool.
+    Workers read their own byte range of the file (see support.parallel_line_map_reduce).
+    """
+    k = 2 if part == 1 else 12
+    return support.parallel_line_map_reduce(
+        path, partial(max_joltage_k, k=k), operator.add, 0, workers
+    )
 
 @log_time
 def part_A():
@@ -127,7 +183,26 @@ def part_A():
 @log_time
 def part_B():
     logger.info("Solving part B")
-    # Placeholder
+
+    # 1. Run Test Case
+    try:
+        testdata = [
+            "987654321111111",
+            "811111111111119",
+            "234234234234278",
+            "818181911112111"
+        ]
+        testcase = problemsolver(testdata, 2)
+        logger.info(f"Test Case B Result: {testcase}")
+        assert testcase == 3121910778619, f"Test case B failed: Expected 3121910778619, got {testcase}"
+    except Exception as e:
+        logger.warning(f"Test case B warning: {e}")
+
+    # 2. Run Real Data
+    if not data:
+        logger.error("No data available for Part B.")
+        return 0
+
     answerB = problemsolver(data, 2)
     return answerB
 
@@ -151,7 +226,7 @@ def main():
     resultA = part_A()
     logger.info(f"part A solution: \n{resultA}\n")
     
-    # Solve part B (Will be 0)
+    # Solve part B
     resultB = part_B()
     logger.info(f"part B solution: \n{resultB}\n")
 
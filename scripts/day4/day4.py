@@ -1,6 +1,7 @@
 import os
 import sys
 import requests
+import numpy as np
 
 # 1. SETUP PATHS
 # Current file: .../AoC2025/scripts/day4/day4.py
@@ -13,10 +14,12 @@ sys.path.append(scripts_dir)
 
 from utils.support import log_time, _877_cache_now, logger, console
 from utils import support
+from utils.grid import Grid
 
 # Set day/year global variables
 DAY: int = 4
 YEAR: int = 2025
+ROLL: int = ord('@')
 
 def manual_fetch():
     """
@@ -49,53 +52,217 @@ def manual_fetch():
         logger.error(f"Manual fetch crashed: {e}")
         return None
 
-def problemsolver(arr: list, part: int):
+def load_roll_mask(grid: list) -> np.ndarray:
+    """(rows, cols) uint8 array with 1 where the grid holds a paper roll '@'."""
+    raw = np.frombuffer("".join(grid).encode(), dtype=np.uint8)
+    return (raw == ord('@')).astype(np.uint8).reshape(len(grid), len(grid[0]))
+
+def neighbor_counts(mask: np.ndarray) -> np.ndarray:
+    """
+    Number of rolls in the 8 surrounding cells of every cell.
+    The mask is padded by one empty cell on each side, then the 8 shifted
+    views of the padded array are added together - no bounds checks needed.
+    """
+    rows, cols = mask.shape
+    padded = np.pad(mask, 1)
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            if dr == 1 and dc == 1:
+                continue
+            counts += padded[dr:dr + rows, dc:dc + cols]
+    return counts
+
+def count_accessible_numpy(grid: list) -> int:
+    """Rolls with fewer than 4 neighboring rolls, counted with one comparison and sum."""
+    mask = load_roll_mask(grid)
+    return int(np.count_nonzero(mask & (neighbor_counts(mask) < 4)))
+
+def remove_accessible_rolls(grid: list):
+    """
+    Part 2: keep removing accessible rolls until none are left.
+
+    Neighbor counts are computed once on the Grid's bordered buffer, so every
+    neighbor is just flat index + offset. A removed roll decrements its
+    neighbors and any that drop below 4 are queued for the next round.
+    Each roll is queued at most once, so the work is O(cells + removals).
+    Rounds follow the puzzle's "remove everything accessible at once" order.
+
+    Returns:
+        (total, per_round): rolls removed overall, and in each round
+    """
+    cells = Grid(grid)
+    padded = (cells.array() == ROLL).astype(np.uint8)
+    counts = np.pad(neighbor_counts(padded[1:-1, 1:-1]), 1)
+
+    present = bytearray(padded.tobytes())
+    remaining = counts.ravel().tolist()
+    frontier = np.flatnonzero(padded & (counts < 4)).tolist()
+    queued = bytearray(len(present))
+    for i in frontier:
+        queued[i] = 1
+
+    offsets = cells.neighbors8
+    per_round = []
+    while frontier:
+        per_round.append(len(frontier))
+        for i in frontier:
+            present[i] = 0
+
+        next_frontier = []
+        for i in frontier:
+            for off in offsets:
+                j = i + off
+                if present[j]:
+                    remaining[j] -= 1
+                    if remaining[j] < 4 and not queued[j]:
+                        queued[j] = 1
+                        next_frontier.append(j)
+        frontier = next_frontier
+
+    return sum(per_round), per_round
+
+# '@' -> 1 bit, '.' -> 0 bit
+ROLL_BITS = str.maketrans("@.", "10")
+
+def row_to_bits(row: str) -> int:
+    """One grid row as an int bitmask (a set bit per roll)."""
+    return int(row.translate(ROLL_BITS), 2) if row else 0
+
+def load_bitboard(grid: list) -> list:
+    """Grid as a list of int row masks, 1 bit per cell instead of a byte or str char."""
+    return [row_to_bits(row) for row in grid]
+
+def row_accessible(above: int, row: int, below: int) -> int:
+    """
+    Bitmask of the rolls in row with fewer than 4 rolls around them.
+
+    The 8 neighbor planes (above / row / below shifted left, right, straight)
+    are added bit-parallel with a ripple counter: b0 and b1 hold the count's
+    low two bits and b2 latches once any column reaches 4. Bits shifted past
+    either edge fall on columns with no roll and get masked off by `row &`.
+    """
+    b0 = b1 = at_least_4 = 0
+    for plane in (
+        above << 1, above, above >> 1,
+        row << 1, row >> 1,
+        below << 1, below, below >> 1,
+    ):
+        carry0 = b0 & plane
+        b0 ^= plane
+        carry1 = b1 & carry0
+        b1 ^= carry0
+        at_least_4 |= carry1
+    return row & ~at_least_4
+
+def count_accessible_bitboard(rows: list) -> int:
+    """Part 1 over int row masks: a few big-int ops per row."""
+    total = 0
+    for r, row in enumerate(rows):
+        above = rows[r - 1] if r > 0 else 0
+        below = rows[r + 1] if r + 1 < len(rows) else 0
+        total += row_accessible(above, row, below).bit_count()
+    return total
+
+def remove_rolls_bitboard(rows: list):
+    """
+    Part 2 over int row masks. Each round removes every accessible roll at
+    once; only rows next to a row that changed last round are re-checked.
+
+    Returns:
+        (total, per_round): rolls removed overall, and in each round
+    """
+    rows = list(rows)
+    n = len(rows)
+    dirty = range(n)
+    per_round = []
+    while True:
+        removals = {}
+        for r in dirty:
+            above = rows[r - 1] if r > 0 else 0
+            below = rows[r + 1] if r + 1 < n else 0
+            acc = row_accessible(above, rows[r], below)
+            if acc:
+                removals[r] = acc
+        if not removals:
+            break
+
+        per_round.append(sum(acc.bit_count() for acc in removals.values()))
+        for r, acc in removals.items():
+            rows[r] &= ~acc
+        dirty = sorted({i for r in removals for i in (r - 1, r, r + 1) if 0 <= i < n})
+
+    return sum(per_round), per_round
+
+def iter_accessible_counts(path: str):
+    """
+    Streams a grid file and yields the accessible roll count of each row as
+    soon as the row below it has been read. Only three row masks (above,
+    current, below) are held at once, so memory is bounded by the row width.
+    """
+    above, row = 0, None
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            below = row_to_bits(line)
+            if row is not None:
+                yield row_accessible(above, row, below).bit_count()
+                above = row
+            row = below
+    if row is not None:
+        yield row_accessible(above, row, 0).bit_count()
+
+def stream_accessible_count(path: str) -> int:
+    """Part 1 over a grid file too big to load (see iter_accessible_counts)."""
+    return sum(iter_accessible_counts(path))
+
+def problemsolver(arr: list, part: int, mode: str = "numpy"):
+    """
+    Modes:
+        numpy:    shifted-sum neighbor counts over the whole grid (default)
+        bitboard: int bitmask per row, bit-parallel neighbor adder
+        loop:     check the 8 neighbor offsets of every roll in a Grid
+    """
     # Filter out empty lines to ensure clean grid
     grid = [row.strip() for row in arr if row.strip()]
     if not grid:
         return 0
 
-    rows = len(grid)
-    cols = len(grid[0])
-    accessible_count = 0
-    
-    # 8 neighbor offsets (diagonals included)
-    # (-1, -1) (-1, 0) (-1, 1)
-    # (0, -1)    XXX    (0, 1)
-    # (1, -1)  (1, 0)  (1, 1)
-    directions = [
-        (-1, -1), (-1, 0), (-1, 1),
-        (0, -1),           (0, 1),
-        (1, -1), (1, 0), (1, 1)
-    ]
+    if part == 1 and mode == "numpy":
+        return count_accessible_numpy(grid)
+
+    if mode == "bitboard":
+        rows = load_bitboard(grid)
+        if part == 1:
+            return count_accessible_bitboard(rows)
+        total, per_round = remove_rolls_bitboard(rows)
+        logger.info(f"Removed {total} rolls over {len(per_round)} rounds")
+        return total
 
     if part == 1:
-        for r in range(rows):
-            for c in range(cols):
-                # We only care if the current spot is a paper roll '@'
-                if grid[r][c] != '@':
-                    continue
-                
-                neighbor_rolls = 0
-                
-                # Check all 8 neighbors
-                for dr, dc in directions:
-                    nr, nc = r + dr, c + dc
-                    
-                    # Boundary Check: Is the neighbor inside the grid?
-                    if 0 <= nr < rows and 0 <= nc < cols:
-                        if grid[nr][nc] == '@':
-                            neighbor_rolls += 1
-                
-                # Rule: "accessible if fewer than 4 rolls in adjacent positions"
-                if neighbor_rolls < 4:
-                    accessible_count += 1
-                    
+        cells = Grid(grid)
+        data = cells.data
+        accessible_count = 0
+
+        # The sentinel border means every neighbor offset is a valid index
+        for i in cells.find('@'):
+            neighbor_rolls = 0
+            for off in cells.neighbors8:
+                if data[i + off] == ROLL:
+                    neighbor_rolls += 1
+
+            # Rule: "accessible if fewer than 4 rolls in adjacent positions"
+            if neighbor_rolls < 4:
+                accessible_count += 1
+
         return accessible_count
 
     if part == 2:
-        # Placeholder for Part 2
-        return 0
+        total, per_round = remove_accessible_rolls(grid)
+        logger.info(f"Removed {total} rolls over {len(per_round)} rounds")
+        return total
 
 @log_time
 def part_A():
@@ -133,7 +300,32 @@ def part_A():
 @log_time
 def part_B():
     logger.info("Solving part B")
-    # Placeholder
+
+    # 1. Run Test Case
+    try:
+        testdata = [
+            "..@@.@@@@.",
+            "@@@.@.@.@@",
+            "@@@@@.@.@@",
+            "@.@@@@..@.",
+            "@@.@@@@.@@",
+            ".@@@@@@@.@",
+            ".@.@.@.@@@",
+            "@.@@@.@@@@",
+            ".@@@@@@@@.",
+            "@.@.@@@.@."
+        ]
+        testcase = problemsolver(testdata, 2)
+        logger.info(f"Test Case B Result: {testcase}")
+        assert testcase == 43, f"Test case B failed: Expected 43, got {testcase}"
+    except Exception as e:
+        logger.warning(f"Test case B warning: {e}")
+
+    # 2. Run Real Data
+    if not data:
+        logger.error("No data available for Part B.")
+        return 0
+
     answerB = problemsolver(data, 2)
     return answerB
 
@@ -157,7 +349,7 @@ def main():
     resultA = part_A()
     logger.info(f"part A solution: \n{resultA}\n")
     
-    # Solve part B (Will be 0)
+    # Solve part B
     resultB = part_B()
     logger.info(f"part B solution: \n{resultB}\n")
 
@@ -1,6 +1,11 @@
 import os
 import sys
+import bisect
+import struct
+import hashlib
 import requests
+import numpy as np
+from itertools import islice
 
 # 1. SETUP PATHS
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -48,6 +53,260 @@ def manual_fetche():
         logger.error(f"Manual fetch crashed: {e}")
         return None
 
+def merge_arrays(starts: np.ndarray, ends: np.ndarray):
+    """
+    Vectorized union of ranges given as int64 start / end arrays.
+
+    After sorting by start (argsort), a new block begins wherever a start is
+    past the running max of all previous ends + 1 (np.maximum.accumulate);
+    the +1 keeps the rule that adjacent ranges (3-4, 5-6) merge. Each block
+    ends at the running max of its last member.
+
+    Returns:
+        (block_starts, block_ends): sorted, disjoint, non adjacent blocks
+    """
+    if starts.size == 0:
+        return starts.copy(), ends.copy()
+
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], ends[order]
+    run_end = np.maximum.accumulate(ends)
+
+    breaks = np.empty(starts.size, dtype=bool)
+    breaks[0] = True
+    breaks[1:] = starts[1:] > run_end[:-1] + 1
+
+    first = np.flatnonzero(breaks)
+    last = np.append(first[1:] - 1, starts.size - 1)
+    return starts[first], run_end[last]
+
+ID_CHUNK: int = 1 << 20
+
+def _block_contains(starts, ends, ingred_id: int) -> bool:
+    """Point membership in sorted disjoint blocks via bisect."""
+    i = bisect.bisect_right(starts, ingred_id) - 1
+    return i >= 0 and ingred_id <= ends[i]
+
+class IntervalIndex:
+    """
+    Merged fresh ranges as sorted int64 start / end arrays.
+    Blocks are disjoint, so an ID is fresh when the last block starting at or
+    before it also ends at or after it - one binary search per ID.
+    """
+    def __init__(self, starts: np.ndarray, ends: np.ndarray):
+        self.starts = starts
+        self.ends = ends
+
+    @classmethod
+    def from_arrays(cls, starts: np.ndarray, ends: np.ndarray):
+        return cls(*merge_arrays(np.asarray(starts, dtype=np.int64), np.asarray(ends, dtype=np.int64)))
+
+    @classmethod
+    def from_ranges(cls, fresh_ranges: list):
+        pairs = np.array(fresh_ranges, dtype=np.int64).reshape(-1, 2)
+        return cls.from_arrays(pairs[:, 0], pairs[:, 1])
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def size(self) -> int:
+        """Number of IDs covered (Part 2)."""
+        return int((self.ends - self.starts + 1).sum())
+
+    def contains(self, ingred_id: int) -> bool:
+        """Point membership via bisect."""
+        return _block_contains(self.starts, self.ends, ingred_id)
+
+    def count_fresh(self, ids) -> int:
+        """Vectorized membership count for a batch of IDs (np.searchsorted)."""
+        ids = np.asarray(ids, dtype=np.int64)
+        if ids.size == 0 or len(self) == 0:
+            return 0
+        i = np.searchsorted(self.starts, ids, side="right") - 1
+        hit = (i >= 0) & (ids <= self.ends[np.maximum(i, 0)])
+        return int(np.count_nonzero(hit))
+
+    def count_fresh_file(self, path: str, chunk_size: int = ID_CHUNK) -> int:
+        """
+        Streams IDs (one per line) from a file in chunks of chunk_size lines,
+        so any number of IDs can be checked in bounded memory.
+        """
+        fresh_count = 0
+        with open(path, "r") as f:
+            while lines := list(islice(f, chunk_size)):
+                ids = np.fromiter((int(x) for x in lines if x.strip()), dtype=np.int64)
+                fresh_count += self.count_fresh(ids)
+        return fresh_count
+
+class DynamicIntervalSet:
+    """
+    Mutable set of fresh IDs kept as sorted, disjoint, non adjacent blocks in
+    two parallel lists, with the union size maintained on every update.
+
+    Inserts merge with any block they overlap or touch; deletes cut the
+    covered IDs out, splitting a block in two if needed. Each update is two
+    bisects plus one slice assignment over the affected blocks (a memmove on
+    the list), so the live catalog never needs a rebuild.
+    Deletes have set semantics: removing a range drops those IDs even if
+    several inserted ranges covered them. An inverted range (start > end)
+    is empty, so adding or removing one is a no-op.
+    """
+    # Batches smaller than this are answered with bisect instead of a NumPy snapshot
+    SMALL_BATCH: int = 64
+
+    def __init__(self, fresh_ranges: list = ()):
+        self.starts = []
+        self.ends = []
+        self.total = 0
+        self._snapshot = None
+        for start, end in fresh_ranges:
+            self.add(start, end)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def size(self) -> int:
+        """Number of IDs covered (Part 2)."""
+        return self.total
+
+    def _span(self, lo: int, hi: int) -> int:
+        return sum(self.ends[i] - self.starts[i] + 1 for i in range(lo, hi))
+
+    def add(self, start: int, end: int):
+        if start > end:
+            return
+        self._snapshot = None
+
+        # Blocks that overlap or touch [start, end]
+        lo = bisect.bisect_left(self.ends, start - 1)
+        hi = bisect.bisect_right(self.starts, end + 1)
+        if lo < hi:
+            start = min(start, self.starts[lo])
+            end = max(end, self.ends[hi - 1])
+        self.total += (end - start + 1) - self._span(lo, hi)
+        self.starts[lo:hi] = [start]
+        self.ends[lo:hi] = [end]
+
+    def remove(self, start: int, end: int):
+        if start > end:
+            return
+
+        # Blocks that overlap [start, end]
+        lo = bisect.bisect_left(self.ends, start)
+        hi = bisect.bisect_right(self.starts, end)
+        if lo >= hi:
+            return
+        self._snapshot = None
+
+        new_starts, new_ends = [], []
+        if self.starts[lo] < start:
+            new_starts.append(self.starts[lo])
+            new_ends.append(start - 1)
+        if self.ends[hi - 1] > end:
+            new_starts.append(end + 1)
+            new_ends.append(self.ends[hi - 1])
+
+        self.total += sum(e - s + 1 for s, e in zip(new_starts, new_ends)) - self._span(lo, hi)
+        self.starts[lo:hi] = new_starts
+        self.ends[lo:hi] = new_ends
+
+    def contains(self, ingred_id: int) -> bool:
+        return _block_contains(self.starts, self.ends, ingred_id)
+
+    def count_fresh(self, ids) -> int:
+        """
+        Part 1 against the current catalog. Small batches bisect the live lists;
+        larger ones use the cached NumPy snapshot, rebuilt only after an update.
+        """
+        if len(ids) < self.SMALL_BATCH:
+            return sum(self.contains(int(ingred_id)) for ingred_id in ids)
+        return self.to_index().count_fresh(ids)
+
+    def to_index(self) -> IntervalIndex:
+        """
+        Snapshot as a static IntervalIndex (for vectorized batches or writing to disk).
+        Cached until the next add / remove that changes the set.
+        """
+        if self._snapshot is None:
+            self._snapshot = IntervalIndex(
+                np.array(self.starts, dtype=np.int64), np.array(self.ends, dtype=np.int64)
+            )
+        return self._snapshot
+
+# On disk layout (little endian):
+#   magic (8s) | block count (q) | source digest (32s) | starts (count x int64) | ends (count x int64)
+INDEX_MAGIC: bytes = b"AOC5IVL1"
+INDEX_HEADER = struct.Struct("<8sq32s")
+
+def ranges_digest(fresh_ranges: list) -> bytes:
+    """sha256 of the raw source ranges (order sensitive), stored in the header."""
+    digest = hashlib.sha256()
+    for start, end in fresh_ranges:
+        digest.update(f"{start}-{end}\n".encode())
+    return digest.digest()
+
+def write_index_file(path: str, index: IntervalIndex, digest: bytes):
+    """Writes the merged blocks as header + packed int64 start / end columns."""
+    with support.atomic_write(path) as f:
+        f.write(INDEX_HEADER.pack(INDEX_MAGIC, len(index), digest))
+        f.write(np.ascontiguousarray(index.starts, dtype="<i8").tobytes())
+        f.write(np.ascontiguousarray(index.ends, dtype="<i8").tobytes())
+
+def _parse_index_header(header: bytes):
+    """(count, digest) from raw header bytes, or None if it isn't an index header."""
+    if len(header) < INDEX_HEADER.size:
+        return None
+    magic, count, digest = INDEX_HEADER.unpack(header)
+    if magic != INDEX_MAGIC:
+        return None
+    return count, digest
+
+def _read_index_header(path: str):
+    """(count, digest) from an index file, or None if missing / not an index file."""
+    try:
+        with open(path, "rb") as f:
+            return _parse_index_header(f.read(INDEX_HEADER.size))
+    except FileNotFoundError:
+        return None
+
+def open_index_file(path: str) -> IntervalIndex:
+    """
+    Memory maps an index file. Nothing is parsed or copied: the start / end
+    columns are read only np.memmap views, so every process that opens the
+    file shares the same page cache pages.
+    Header, size check and mapping all go through one open handle, so a
+    concurrent rebuild swapping the file in can't mix two versions.
+    """
+    with open(path, "rb") as f:
+        header = _parse_index_header(f.read(INDEX_HEADER.size))
+        if header is None:
+            raise ValueError(f"{path} is not a day 5 interval index file")
+        count, _ = header
+
+        expected = INDEX_HEADER.size + 16 * count
+        actual = os.fstat(f.fileno()).st_size
+        if actual != expected:
+            raise ValueError(
+                f"{path} is truncated or corrupt: {actual} bytes, expected {expected} for {count} blocks"
+            )
+        if count == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return IntervalIndex(empty, empty)
+        columns = np.memmap(f, dtype="<i8", mode="r", offset=INDEX_HEADER.size, shape=(2, count))
+    return IntervalIndex(columns[0], columns[1])
+
+def load_or_build_index(path: str, fresh_ranges: list) -> IntervalIndex:
+    """
+    Opens the index file at path, rebuilding it first only if it's missing
+    or was built from different source ranges.
+    """
+    digest = ranges_digest(fresh_ranges)
+    header = _read_index_header(path)
+    if header is None or header[1] != digest:
+        logger.info(f"Building interval index file {path}")
+        write_index_file(path, IntervalIndex.from_ranges(fresh_ranges), digest)
+    return open_index_file(path)
+
 def problemsolver(arr: list, part: int):
     # 1. Parse Input
     fresh_ranges = []
@@ -72,49 +331,15 @@ def problemsolver(arr: list, part: int):
             # Parse ID
             available_ids.append(int(line))
 
+    index = IntervalIndex.from_ranges(fresh_ranges)
+
     # --- PART 1: Check Candidates ---
     if part == 1:
-        fresh_count = 0
-        for ingred_id in available_ids:
-            is_fresh = False
-            for start, end in fresh_ranges:
-                if start <= ingred_id <= end:
-                    is_fresh = True
-                    break
-            if is_fresh:
-                fresh_count += 1
-        return fresh_count
+        return index.count_fresh(available_ids)
 
     # --- PART 2: Calculate Union Volume ---
     if part == 2:
-        # Sort by start time
-        fresh_ranges.sort(key=lambda x: x[0])
-        
-        if not fresh_ranges:
-            return 0
-            
-        merged_count = 0
-        
-        # Initialize with the first range
-        curr_start, curr_end = fresh_ranges[0]
-        
-        for i in range(1, len(fresh_ranges)):
-            next_start, next_end = fresh_ranges[i]
-            
-            # Check for overlap or adjacency
-            # If next starts inside (or immediately after) current, we merge.
-            # (Using +1 allows 3-4 and 5-6 to merge into 3-6)
-            if next_start <= curr_end + 1:
-                curr_end = max(curr_end, next_end)
-            else:
-                # No overlap. Add current block to total and start a new one.
-                merged_count += (curr_end - curr_start + 1)
-                curr_start, curr_end = next_start, next_end
-        
-        # Add the final block
-        merged_count += (curr_end - curr_start + 1)
-        
-        return merged_count
+        return index.size()
 
 @log_time
 def part_A():
@@ -1,6 +1,7 @@
 import os
 import sys
 import requests
+import numpy as np
 from collections import Counter
 
 # 1. SETUP PATHS
@@ -13,10 +14,12 @@ sys.path.append(scripts_dir)
 
 from utils.support import log_time, _877_cache_now, logger, console
 from utils import support
+from utils.grid import Grid, BORDER
 
 # Set day/year global variables
 DAY: int = 7
 YEAR: int = 2025
+SPLITTER: int = ord('^')
 
 def manual_fetch_override():
     """
@@ -49,82 +52,238 @@ def manual_fetch_override():
         logger.error(f"Manual fetch crashed: {e}")
         return None
 
-def problemsolver(arr: list, part: int):
+# Counts above this could overflow int64 in one step (a cell gets at most 3 inflows)
+SAFE_COUNT: int = np.iinfo(np.int64).max // 3
+
+def timeline_step(counts: np.ndarray, split: np.ndarray):
+    """
+    Pushes the timeline counts through one row.
+
+    counts has one overflow cell on each side of the grid columns; split is
+    the row's bool splitter mask. Split beams shift one cell left and right,
+    the rest pass straight down. Anything landing in an overflow cell has left
+    the manifold and is returned as the exited count.
+    Counts switch from int64 to exact Python ints (object dtype) only once
+    they get big enough to overflow.
+    """
+    if counts.dtype != object and counts.max() > SAFE_COUNT:
+        counts = counts.astype(object)
+
+    inner = counts[1:-1]
+    hit = np.where(split, inner, 0)
+    next_counts = np.zeros_like(counts)
+    next_counts[1:-1] += inner - hit
+    next_counts[:-2] += hit
+    next_counts[2:] += hit
+
+    exited = int(next_counts[0]) + int(next_counts[-1])
+    next_counts[0] = next_counts[-1] = 0
+    return next_counts, exited
+
+def count_timelines_array(grid: Grid, start_col: int) -> int:
+    """
+    Part 2 as a dense row DP: one count per column (plus overflow cells),
+    each row a vectorized shift-and-add.
+    """
+    # Border bytes are never '^', so the interior of the padded view is the splitter map
+    splitters = grid.array()[1:-1, 1:-1] == SPLITTER
+
+    counts = np.zeros(grid.cols + 2, dtype=np.int64)
+    counts[start_col + 1] = 1
+    final_timelines = 0
+    for split in splitters:
+        counts, exited = timeline_step(counts, split)
+        final_timelines += exited
+
+    # Add any timelines remaining at the bottom of the grid
+    return final_timelines + int(sum(counts.tolist()))
+
+def split_masks(grid: Grid) -> list:
+    """Each row's splitters as one int bitmask (bit c set = '^' in column c)."""
+    splitters = grid.array()[1:-1, 1:-1] == SPLITTER
+    packed = np.packbits(splitters, axis=1, bitorder="little")
+    return [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+def beam_step(beams: int, split: int, full: int):
+    """
+    Moves the beam bitset down one row: beams on a splitter go left and right,
+    the rest carry straight on. Bits pushed past either edge are dropped
+    (>> 1 drops column -1, & full drops column `cols`).
+
+    Returns:
+        (next_beams, splits): the new bitset, and how many beams were split
+    """
+    hit = beams & split
+    return ((hit << 1) | (hit >> 1) | (beams & ~split)) & full, hit.bit_count()
+
+def count_splits_bitset(grid: Grid, start_col: int) -> int:
+    """Part 1 with the active beams as one big int: a few int ops per row."""
+    full = (1 << grid.cols) - 1
+    beams = 1 << start_col
+    total_splits = 0
+    for split in split_masks(grid):
+        beams, splits = beam_step(beams, split, full)
+        total_splits += splits
+        if not beams: break
+    return total_splits
+
+def stream_manifold(path: str):
+    """
+    Solves both parts in one pass over a manifold file, one row at a time.
+    Only the beam bitset (Part 1) and the per column timeline counts (Part 2)
+    are kept, so memory is bounded by the row width, not the height.
+
+    Returns:
+        (total_splits, final_timelines)
+    """
+    total_splits = 0
+    final_timelines = 0
+    counts = None
+
+    with open(path, "r") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip():
+                continue
+
+            if counts is None:
+                # First row sets the width and holds 'S'
+                width = len(line)
+                start_col = line.find('S')
+                if start_col == -1:
+                    logger.error("No start 'S' found!")
+                    return 0, 0
+                full = (1 << width) - 1
+                beams = 1 << start_col
+                counts = np.zeros(width + 2, dtype=np.int64)
+                counts[start_col + 1] = 1
+
+            row = np.frombuffer(line[:width].ljust(width, '.').encode(), dtype=np.uint8)
+            split = row == SPLITTER
+            split_bits = int.from_bytes(np.packbits(split, bitorder="little").tobytes(), "little")
+
+            beams, splits = beam_step(beams, split_bits, full)
+            total_splits += splits
+            counts, exited = timeline_step(counts, split)
+            final_timelines += exited
+
+    if counts is None:
+        return 0, 0
+    return total_splits, final_timelines + int(sum(counts.tolist()))
+
+def timelines_from_all_columns(arr: list) -> np.ndarray:
+    """
+    Part 2 for every possible start column at once, via one bottom up DP.
+
+    ways[c] is the number of exit timelines for a beam entering column c of
+    the current row. Below the last row (and off either side) every beam is
+    exactly one timeline. Walking up: a splitter sums its left and right
+    neighbors' ways, anything else copies the way below.
+    Stays int64 until a value could overflow, then switches to exact ints.
+
+    Returns:
+        ways (np.ndarray): timelines per top row column; index it with any set of start columns
+    """
+    rows = [row for row in arr if row.strip()]
+    if not rows:
+        return np.zeros(0, dtype=np.int64)
+
+    grid = Grid(rows)
+    splitters = grid.array()[1:-1, 1:-1] == SPLITTER
+
+    ways = np.ones(grid.cols + 2, dtype=np.int64)
+    for split in splitters[::-1]:
+        # A cell gets at most 2 inflows, so halve the headroom
+        if ways.dtype != object and ways.max() > np.iinfo(np.int64).max // 2:
+            ways = ways.astype(object)
+        ways[1:-1] = np.where(split, ways[:-2] + ways[2:], ways[1:-1])
+    return ways[1:-1]
+
+def problemsolver(arr: list, part: int, mode: str = "array"):
+    """
+    Modes:
+        array:   Part 1 bitset beams, Part 2 dense per column counts (default)
+        counter: set / Counter of active beams
+    """
     # Filter empty lines
-    grid = [row for row in arr if row.strip()]
-    if not grid:
+    rows = [row for row in arr if row.strip()]
+    if not rows:
         return 0
 
-    rows = len(grid)
-    cols = len(grid[0])
-    
-    # Find Start 'S'
-    start_col = -1
-    for c in range(cols):
-        if grid[0][c] == 'S':
-            start_col = c
-            break
-            
-    if start_col == -1:
+    # Beams are tracked by flat Grid index: one row down is + width, and
+    # stepping off either side lands on the sentinel border (no bounds checks)
+    grid = Grid(rows)
+    data = grid.data
+    down = grid.width
+
+    # Find Start 'S' (must be on the top row)
+    start = grid.find_first('S')
+    if start == -1 or grid.coords(start)[0] != 0:
         logger.error("No start 'S' found!")
         return 0
 
     # --- PART 1: Count Splits (Simulation) ---
+    if part == 1 and mode == "array":
+        return count_splits_bitset(grid, grid.coords(start)[1])
+
     if part == 1:
-        active_cols = {start_col}
+        active = {start}
         total_splits = 0
         
-        for r in range(rows):
+        for r in range(grid.rows):
             next_active = set()
-            for c in active_cols:
-                # Boundary check
-                if c < 0 or c >= cols:
-                    continue
+            for i in active:
+                char = data[i]
                 
-                char = grid[r][c]
+                # Beam left the manifold
+                if char == BORDER:
+                    continue
                 
-                if char == '^':
+                if char == SPLITTER:
                     total_splits += 1
                     # Split logic: next row gets c-1 and c+1
-                    next_active.add(c - 1)
-                    next_active.add(c + 1)
+                    next_active.add(i + down - 1)
+                    next_active.add(i + down + 1)
                 else:
                     # Pass through logic: next row gets c
-                    next_active.add(c)
+                    next_active.add(i + down)
             
-            active_cols = next_active
-            if not active_cols: break
+            active = next_active
+            if not active: break
             
         return total_splits
 
     # --- PART 2: Count Timelines (Path Counting) ---
+    if part == 2 and mode == "array":
+        return count_timelines_array(grid, grid.coords(start)[1])
+
     if part == 2:
-        # Map of column_index -> count_of_timelines
+        # Map of flat index -> count_of_timelines
         # We start with 1 timeline at S
         timeline_counts = Counter()
-        timeline_counts[start_col] = 1
+        timeline_counts[start] = 1
         
         final_timelines = 0
         
-        for r in range(rows):
+        for r in range(grid.rows):
             next_counts = Counter()
             
-            for c, count in timeline_counts.items():
-                # If a beam is out of bounds, it has "exited the manifold"
+            for i, count in timeline_counts.items():
+                char = data[i]
+
+                # If a beam is on the border, it has "exited the manifold"
                 # We count it as a finished timeline and don't propagate it.
-                if c < 0 or c >= cols:
+                if char == BORDER:
                     final_timelines += count
                     continue
                 
-                char = grid[r][c]
-                
-                if char == '^':
+                if char == SPLITTER:
                     # Split: The count propagates to both Left and Right in next row
-                    next_counts[c - 1] += count
-                    next_counts[c + 1] += count
+                    next_counts[i + down - 1] += count
+                    next_counts[i + down + 1] += count
                 else:
                     # Pass through: The count propagates straight down
-                    next_counts[c] += count
+                    next_counts[i + down] += count
             
             timeline_counts = next_counts
             
@@ -2,6 +2,7 @@ import os
 import sys
 import math
 import requests
+import numpy as np
 
 # 1. SETUP PATHS
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -73,7 +74,67 @@ class DSU:
             return True # Merged successfully
         return False # Already in same set
 
-def problemsolver(arr: list, part: int):
+# Target size of one block of the distance matrix
+PAIR_BLOCK: int = 1 << 20
+
+def shortest_pairs(points: np.ndarray, k: int, block_cells: int = PAIR_BLOCK):
+    """
+    The k closest pairs (i < j) by squared distance, without building all pairs.
+
+    Squared distances are exact int64 (no sqrt) and computed a block of rows
+    at a time with broadcasting. Each block keeps only its candidates at or
+    under the running k-th smallest distance (np.partition, ties included),
+    and the final k are fully sorted. Ties break by (i, j), same as the
+    stable sort over the i, j loop order.
+
+    Args:
+        points (np.ndarray): (N, 3) int64 coordinates
+        k (int): How many pairs you want
+        block_cells (int, optional): Distance cells per block. Defaults to PAIR_BLOCK.
+
+    Returns:
+        (dist_sq, i, j): int64 arrays of the k closest pairs, in order
+    """
+    n = len(points)
+    k = min(k, n * (n - 1) // 2)
+    best_d = np.zeros(0, dtype=np.int64)
+    best_key = np.zeros(0, dtype=np.int64)  # i * n + j, orders ties by (i, j)
+    if k <= 0:
+        return best_d, best_key, best_key
+
+    step = max(1, block_cells // n)
+    for lo in range(0, n - 1, step):
+        hi = min(lo + step, n - 1)
+        # Rows lo..hi-1 against every later point
+        rows = points[lo:hi]
+        cols = points[lo + 1:]
+        dist_sq = np.zeros((hi - lo, n - lo - 1), dtype=np.int64)
+        for axis in range(points.shape[1]):
+            diff = rows[:, axis, None] - cols[None, :, axis]
+            dist_sq += diff * diff
+
+        i = np.arange(lo, hi)[:, None]
+        j = np.arange(lo + 1, n)[None, :]
+        upper = j > i
+        cand_d = np.concatenate((best_d, dist_sq[upper]))
+        cand_key = np.concatenate((best_key, (i * n + j)[upper]))
+
+        if cand_d.size > k:
+            kth = np.partition(cand_d, k - 1)[k - 1]
+            keep = cand_d <= kth
+            cand_d, cand_key = cand_d[keep], cand_key[keep]
+        best_d, best_key = cand_d, cand_key
+
+    order = np.lexsort((best_key, best_d))[:k]
+    best_d, best_key = best_d[order], best_key[order]
+    return best_d, best_key // n, best_key % n
+
+def problemsolver(arr: list, part: int, mode: str = "numpy"):
+    """
+    Modes:
+        numpy: blocked int64 distances + partial top-k selection (default)
+        loop:  every pair as a Python tuple, fully sorted
+    """
     # 1. Parse Input to Coordinates
     points = []
     for line in arr:
@@ -85,26 +146,6 @@ def problemsolver(arr: list, part: int):
     num_points = len(points)
     if num_points == 0: return 0
 
-    # 2. Calculate All Pairwise Distances
-    # We store edges as (distance, idx_a, idx_b)
-    edges = []
-    
-    # Pre-calculate distances is O(N^2).
-    # If N is huge (like 2000+), this is ~4M ops, which is fine for Python.
-    for i in range(num_points):
-        for j in range(i + 1, num_points):
-            x1, y1, z1 = points[i]
-            x2, y2, z2 = points[j]
-            dist_sq = (x1-x2)**2 + (y1-y2)**2 + (z1-z2)**2
-            dist = math.sqrt(dist_sq)
-            edges.append((dist, i, j))
-            
-    # 3. Sort Edges by Distance (Shortest First)
-    edges.sort(key=lambda x: x[0])
-    
-    # 4. Process Connections
-    dsu = DSU(num_points)
-    
     # The prompt defines how many connections to make
     # "After making the ten shortest connections" (example)
     # "connect together the 1000 pairs of junction boxes" (actual problem)
@@ -121,8 +162,33 @@ def problemsolver(arr: list, part: int):
         # Test case wants 10 connections
         limit = 10
 
-    # Apply the logic: Take the top K shortest edges
-    active_edges = edges[:limit]
+    if mode == "numpy":
+        # 2/3. Only the `limit` shortest pairs, already in order
+        dist_sq, idx_a, idx_b = shortest_pairs(np.array(points, dtype=np.int64), limit)
+        active_edges = zip(dist_sq.tolist(), idx_a.tolist(), idx_b.tolist())
+    else:
+        # 2. Calculate All Pairwise Distances
+        # We store edges as (distance, idx_a, idx_b)
+        edges = []
+        
+        # Pre-calculate distances is O(N^2).
+        # If N is huge (like 2000+), this is ~4M ops, which is fine for Python.
+        for i in range(num_points):
+            for j in range(i + 1, num_points):
+                x1, y1, z1 = points[i]
+                x2, y2, z2 = points[j]
+                dist_sq = (x1-x2)**2 + (y1-y2)**2 + (z1-z2)**2
+                dist = math.sqrt(dist_sq)
+                edges.append((dist, i, j))
+                
+        # 3. Sort Edges by Distance (Shortest First)
+        edges.sort(key=lambda x: x[0])
+
+        # Apply the logic: Take the top K shortest edges
+        active_edges = edges[:limit]
+    
+    # 4. Process Connections
+    dsu = DSU(num_points)
     
     for dist, u, v in active_edges:
         dsu.union(u, v)
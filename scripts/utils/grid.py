@@ -0,0 +1,77 @@
+import numpy as np
+
+################################# Grid ######################################
+# Byte used for the sentinel border.  Never a puzzle character, so a lookup
+# that walks off the edge just reads BORDER instead of needing a bounds check.
+BORDER: int = 0
+
+class Grid:
+    """
+    Compact character grid for the map style puzzles.  Cells live in one flat
+    bytearray, row major, wrapped in a one cell BORDER frame.  A cell is
+    addressed by its flat index, so moving around is plain integer math:
+    up is i - width, right is i + 1, and any neighbor of an interior cell is
+    always a valid index.
+
+    Args:
+        lines (list): Grid rows as strings. Short rows are padded with BORDER.
+    """
+    __slots__ = ("rows", "cols", "width", "data", "neighbors4", "neighbors8")
+
+    def __init__(self, lines:list):
+        self.rows = len(lines)
+        self.cols = max((len(line) for line in lines), default=0)
+        self.width = self.cols + 2
+
+        frame = bytes([BORDER])
+        blank = frame * self.width
+        body = b"".join(
+            frame + line.encode().ljust(self.cols, frame) + frame for line in lines
+        )
+        self.data = bytearray(blank + body + blank)
+
+        w = self.width
+        self.neighbors4 = (-w, -1, 1, w)
+        self.neighbors8 = (-w - 1, -w, -w + 1, -1, 1, w - 1, w, w + 1)
+
+    def index(self, r:int, c:int) -> int:
+        """Flat index of (row, col)."""
+        return (r + 1) * self.width + c + 1
+
+    def coords(self, i:int) -> tuple:
+        """(row, col) of a flat index."""
+        r, c = divmod(i, self.width)
+        return r - 1, c - 1
+
+    def __getitem__(self, i:int) -> str:
+        return chr(self.data[i])
+
+    def in_bounds(self, i:int) -> bool:
+        """False for any index on the sentinel border."""
+        return self.data[i] != BORDER
+
+    def find(self, char:str) -> list:
+        """Flat indices of every cell holding char, in row major order."""
+        target = char.encode()
+        found = []
+        i = self.data.find(target)
+        while i != -1:
+            found.append(i)
+            i = self.data.find(target, i + 1)
+        return found
+
+    def find_first(self, char:str) -> int:
+        """Flat index of the first cell holding char, or -1."""
+        return self.data.find(char.encode())
+
+    def row(self, r:int) -> memoryview:
+        """Zero copy view of the interior cells of row r."""
+        start = self.index(r, 0)
+        return memoryview(self.data)[start:start + self.cols]
+
+    def array(self) -> np.ndarray:
+        """
+        Zero copy (rows + 2, cols + 2) uint8 view, border included.
+        Writes to the array show up in the grid and vice versa.
+        """
+        return np.frombuffer(self.data, dtype=np.uint8).reshape(self.rows + 2, self.width)
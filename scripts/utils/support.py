@@ -1,14 +1,17 @@
 import os
 import time
 import logging
+import tempfile
 import datetime
 import percache
 import requests
 import numpy as np
-from typing import Any
+from typing import Any, Callable
 from pathlib import Path
+from contextlib import contextmanager
 from bs4 import BeautifulSoup
 from datetime import timedelta
+from concurrent.futures import ProcessPoolExecutor
 from rich.console import Console
 from rich.logging import RichHandler
 
@@ -115,6 +118,128 @@ def log_time(fn):
         return out
     return inner
 
+################################ File Funcs #################################
+@contextmanager
+def atomic_write(path:Path|str, mode:str="wb"):
+    """Opens a private temp file next to path for writing and renames it over
+    path once the block exits cleanly.  Every writer gets its own temp file,
+    so concurrent writers never clobber each other and readers only ever see
+    a complete file.  If the block raises, the temp file is removed and path
+    is left untouched.
+
+    Args:
+        path (Path|str): Final destination of the file
+        mode (str, optional): Open mode for the temp file. Defaults to "wb".
+
+    Yields:
+        f (file): Open temp file to write into
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+################################ Parallel Funcs #############################
+def _line_chunks(path:Path, n_chunks:int) -> list:
+    """Splits a file into n_chunks byte ranges of about equal size.  Each
+    boundary is pushed forward to the start of the next line so no line is
+    ever cut in two.
+
+    Args:
+        path (Path): File to split
+        n_chunks (int): How many chunks you want
+
+    Returns:
+        chunks (list): (start, end) byte offsets, end exclusive
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, n_chunks):
+            f.seek(max(size * i // n_chunks, bounds[-1]))
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+def _reduce_lines(lines, func:Callable, reducer:Callable, initial:Any) -> Any:
+    """Folds func over every non empty (stripped) line with reducer."""
+    acc = initial
+    for line in lines:
+        line = line.strip()
+        if line:
+            acc = reducer(acc, func(line))
+    return acc
+
+def _reduce_file_chunk(path:Path, start:int, end:int, func:Callable, reducer:Callable, initial:Any) -> Any:
+    """Process pool worker.  Reads its own byte range straight from the file."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode()
+    return _reduce_lines(text.splitlines(), func, reducer, initial)
+
+def parallel_line_map_reduce(
+        source:Path|str|list,
+        func:Callable,
+        reducer:Callable,
+        initial:Any,
+        workers:int=None,
+        chunks_per_worker:int=4
+    ) -> Any:
+    """Map-reduce over independent input lines on a process pool.  Handy for
+    any solver that is just a sum (or max, etc) of a per line function.
+
+    For a file path the workers are only sent byte offsets and read their
+    chunk themselves, so the data never gets pickled.  A list of lines is
+    split into slices of about equal total length and shipped to the workers.
+    func and reducer must be top level (picklable) callables, reducer must be
+    associative and initial its identity, since chunk results are combined
+    in whatever grouping the chunks fall in.
+
+    Args:
+        source (Path|str|list): Input file path, or a list of lines
+        func (Callable): Per line function. Gets each non empty stripped line
+        reducer (Callable): Combines two results, ie operator.add
+        initial (Any): Identity value for reducer, ie 0 for a sum
+        workers (int, optional): Pool size. Defaults to os.cpu_count().
+        chunks_per_worker (int, optional): Extra chunks for load balancing. Defaults to 4.
+
+    Returns:
+        result (Any): Reduced value over every line
+    """
+    workers = workers or os.cpu_count() or 1
+    n_chunks = workers * chunks_per_worker
+
+    if isinstance(source, (str, Path)):
+        jobs = [(_reduce_file_chunk, (source, lo, hi)) for lo, hi in _line_chunks(source, n_chunks)]
+    else:
+        # Balance by characters, not line count
+        target = max(1, sum(len(line) for line in source) // n_chunks)
+        jobs, start, weight = [], 0, 0
+        for i, line in enumerate(source):
+            weight += len(line) + 1
+            if weight >= target:
+                jobs.append((_reduce_lines, (source[start:i + 1],)))
+                start, weight = i + 1, 0
+        if start < len(source):
+            jobs.append((_reduce_lines, (source[start:],)))
+
+    result = initial
+    if workers == 1 or len(jobs) <= 1:
+        for fn, args in jobs:
+            result = reducer(result, fn(*args, func, reducer, initial))
+        return result
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(fn, *args, func, reducer, initial) for fn, args in jobs]
+        for future in futures:
+            result = reducer(result, future.result())
+    return result
+
 ################################ data pulling/cache managment funcs #########
 def _877_cache_now(
         cache_file:str=".cache", 